@@ -5,15 +5,17 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import os
 import signal
+from concurrent.futures import Executor
 from typing import Any
 
 import urllib3  # docker ends up using this and it causes lots of noise, so turn off warnings
 from jupyter_client import localinterfaces
 
 from ..kernels.remotemanager import RemoteKernelManager
-from .processproxy import RemoteProcessProxy
+from .processproxy import RemoteProcessProxy, poll_interval
 
 urllib3.disable_warnings()
 
@@ -40,6 +42,11 @@ class ContainerProcessProxy(RemoteProcessProxy):
     Kernel lifecycle management for container-based kernels.
     """
 
+    # The executor on which blocking container status requests are run while confirming startup.
+    # When None, get_container_status() is called directly from the event loop (and bulk_terminate()
+    # uses the event loop's default executor).
+    status_executor: Executor | None = None
+
     def __init__(self, kernel_manager: RemoteKernelManager, proxy_config: dict):
         """Initialize the proxy."""
         super().__init__(kernel_manager, proxy_config)
@@ -193,9 +200,9 @@ class ContainerProcessProxy(RemoteProcessProxy):
         ready_to_connect = False  # we're ready to connect when we have a connection file to use
         while not ready_to_connect:
             i += 1
-            await self.handle_timeout()
+            await self.handle_timeout(self.next_poll_delay(i))
 
-            container_status = self.get_container_status(i)
+            container_status = await self.get_container_status_async(i)
             if container_status:
                 if container_status in self.get_error_states():
                     self.log_and_raise(
@@ -212,6 +219,57 @@ class ContainerProcessProxy(RemoteProcessProxy):
             else:
                 self.detect_launch_failure()
 
+    def next_poll_delay(self, iteration: int) -> float:
+        """Returns the number of seconds to wait prior to the given iteration of confirming startup.
+
+        The delay starts at a tenth of EG_POLL_INTERVAL and doubles with each iteration, up to
+        twice EG_POLL_INTERVAL, so quickly starting containers are detected promptly while slower
+        ones (e.g., those pulling their image) are not polled needlessly.
+        """
+        # The exponent is bounded so long launches don't overflow - 2**5 tenths exceed the cap.
+        return min(poll_interval / 10 * 2 ** min(iteration - 1, 5), poll_interval * 2)
+
+    async def get_container_status_async(self, iteration: int | None) -> str:
+        """Returns the current container state, running the request on status_executor if set."""
+        if self.status_executor is None:
+            return self.get_container_status(iteration)
+        return await asyncio.get_event_loop().run_in_executor(
+            self.status_executor, self.get_container_status, iteration
+        )
+
+    @classmethod
+    async def bulk_terminate(cls, proxies: list[ContainerProcessProxy]) -> list[bool | None]:
+        """Terminates the container resources of multiple kernels concurrently.
+
+        Each proxy's terminate_container_resources() is run on status_executor, returning
+        their results in the order of `proxies`.  As with kill(), proxies without a container
+        name have nothing to terminate and yield None.  A termination that raises an exception
+        yields False, as do those that fail, so it doesn't prevent the others from being reported.
+
+        Note: this is not yet called by the kernel managers, which terminate each kernel's
+        resources individually via kill().
+        """
+        loop = asyncio.get_event_loop()
+        named = [proxy for proxy in proxies if proxy.container_name]
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(cls.status_executor, proxy.terminate_container_resources)
+                for proxy in named
+            ),
+            return_exceptions=True,
+        )
+        terminated = {}
+        for proxy, result in zip(named, results):
+            if isinstance(result, Exception):
+                proxy.log.warning(
+                    f"Error occurred terminating container resources of kernel "
+                    f"'{proxy.kernel_id}': {result}"
+                )
+                terminated[id(proxy)] = False
+            else:
+                terminated[id(proxy)] = result
+        return [terminated.get(id(proxy)) for proxy in proxies]
+
     def get_process_info(self) -> dict[str, Any]:
         """Captures the base information necessary for kernel persistence relative to containers."""
         process_info = super().get_process_info()
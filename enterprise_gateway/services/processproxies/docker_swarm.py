@@ -4,18 +4,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from typing import Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, ClassVar
 
 from docker.client import DockerClient
 from docker.errors import NotFound
-from docker.models.containers import Container
-from docker.models.services import Service
 
 # Debug logging level of docker produces too much noise - raise to info by default.
 from ..kernels.remotemanager import RemoteKernelManager
 from .container import ContainerProcessProxy
+from .processproxy import poll_interval
 
 logging.getLogger("urllib3.connectionpool").setLevel(
     os.environ.get("EG_DOCKER_LOG_LEVEL", logging.WARNING)
@@ -23,7 +26,202 @@ logging.getLogger("urllib3.connectionpool").setLevel(
 
 docker_network = os.environ.get("EG_DOCKER_NETWORK", "bridge")
 
-client = DockerClient.from_env()
+# Number of seconds a listing of kernel services or containers is reused before re-querying docker.
+docker_cache_ttl = float(os.environ.get("EG_DOCKER_CACHE_TTL", "1.0"))
+
+# Maximum number of threads issuing (blocking) docker requests on behalf of the event loop.
+docker_max_workers = int(os.environ.get("EG_DOCKER_MAX_WORKERS", "8"))
+
+# Number of connections to the docker daemon kept open for reuse.  docker-py defaults to 10,
+# beyond which concurrent requests open (and then discard) additional connections.
+docker_max_pool_size = int(os.environ.get("EG_DOCKER_MAX_POOL_SIZE", "64"))
+
+client = DockerClient.from_env(max_pool_size=docker_max_pool_size)
+
+# Bounded so that a large number of starting kernels cannot overwhelm the docker daemon.
+docker_executor = ThreadPoolExecutor(max_workers=docker_max_workers)
+
+# Selects all resources carrying a kernel_id label, regardless of its value.  Filter values are
+# given as lists, the form in which docker expects them, so docker-py needn't convert them.
+kernel_label_filters = {"label": ["kernel_id"]}
+
+
+class KernelResourceIndex:
+    """
+    Indexes the docker resources (services or containers) labeled with a kernel_id.
+
+    Rather than each process proxy listing its own resource, a single listing of all resources
+    carrying the kernel_id label is shared across proxies and refreshed at most once every
+    `ttl` seconds.  This reduces the requests against the docker daemon from one per kernel
+    to one per refresh period.
+    """
+
+    def __init__(self, list_resources: Callable, get_kernel_id: Callable, ttl: float):
+        """Initialize the index."""
+        self.list_resources = list_resources
+        self.get_kernel_id = get_kernel_id
+        self.ttl = ttl
+        self._resources: dict[str, list] = {}
+        self._timestamp = None
+        self._lock = threading.Lock()
+        self._pending_refresh: asyncio.Future | None = None
+
+    def refresh(self) -> None:
+        """Lists all resources with a kernel_id label and indexes them by that label's value."""
+        resources: dict[str, list] = {}
+        for resource in self.list_resources(filters=kernel_label_filters):
+            resources.setdefault(self.get_kernel_id(resource), []).append(resource)
+        self._resources = resources
+        self._timestamp = time.monotonic()
+
+    def is_expired(self) -> bool:
+        """Returns True if the index has not been refreshed within the last `ttl` seconds."""
+        return self._timestamp is None or time.monotonic() - self._timestamp >= self.ttl
+
+    def get(self, kernel_id: str) -> list:
+        """Returns the resources labeled with kernel_id, refreshing the index if it has expired."""
+        with self._lock:
+            # Callers waiting on the lock share the refresh performed by the first caller.
+            if self.is_expired():
+                self.refresh()
+            return list(self._resources.get(kernel_id, []))
+
+    async def refresh_if_expired(self) -> None:
+        """Refreshes an expired index on docker_executor without blocking the event loop.
+
+        Concurrent callers await the same pending refresh rather than each occupying an
+        executor thread waiting on the index's lock.
+        """
+        if not self.is_expired():
+            return
+        if self._pending_refresh is None:
+            self._pending_refresh = asyncio.get_event_loop().run_in_executor(
+                docker_executor, self._refresh_expired
+            )
+            self._pending_refresh.add_done_callback(self._clear_pending_refresh)
+        await asyncio.shield(self._pending_refresh)
+
+    def _refresh_expired(self) -> None:
+        with self._lock:
+            if self.is_expired():
+                self.refresh()
+
+    def _clear_pending_refresh(self, _: asyncio.Future) -> None:
+        self._pending_refresh = None
+
+    def discard(self, kernel_id: str) -> None:
+        """Removes the resources of kernel_id from the index (e.g., following their removal)."""
+        with self._lock:
+            self._resources.pop(kernel_id, None)
+
+    def invalidate(self) -> None:
+        """Expires the index so that the next lookup refreshes it (e.g., following a docker event)."""
+        with self._lock:
+            self._timestamp = None
+
+
+# The low-level API is used to obtain the raw service and container dicts.  This avoids model
+# construction and, for containers, the per-container inspect request issued by containers.list().
+service_index = KernelResourceIndex(
+    client.api.services,
+    lambda service: service["Spec"]["Labels"]["kernel_id"],
+    docker_cache_ttl,
+)
+container_index = KernelResourceIndex(
+    client.api.containers, lambda container: container["Labels"]["kernel_id"], docker_cache_ttl
+)
+
+
+class KernelEventMonitor:
+    """
+    Wakes kernels awaiting startup when docker reports lifecycle events on their containers.
+
+    A single daemon thread follows docker's event stream for containers labeled with a kernel_id,
+    expiring `index` and setting the asyncio.Event registered for the corresponding kernel.  This
+    replaces a polling request per kernel with one long-lived connection.  Polling remains as a
+    fallback should the stream be unavailable, in which case opening it is re-attempted upon a
+    registration at most once every `retry_interval` seconds.
+    """
+
+    # Container actions that change a kernel's state.  Others (exec_*, health_status, attach, ...)
+    # are ignored so they don't force a new listing of all kernel containers.
+    lifecycle_actions: ClassVar = frozenset({"create", "start", "die", "destroy"})
+
+    # Minimum number of seconds between attempts to open the event stream.
+    retry_interval: ClassVar = 30.0
+
+    def __init__(self, index: KernelResourceIndex):
+        """Initialize the monitor."""
+        self.index = index
+        self.log = None
+        self.connected = False  # True while the event stream is open
+        self._events: dict[str, asyncio.Event] = {}
+        self._loop = None
+        self._thread = None
+        self._last_attempt = None
+        self._outage_logged = False
+
+    def register(self, kernel_id: str, log: logging.Logger) -> asyncio.Event:
+        """Returns the event that is set when docker reports activity on the kernel's container."""
+        self.log = log
+        self._loop = asyncio.get_event_loop()
+        following = self._thread is not None and self._thread.is_alive()
+        if not following and (
+            self._last_attempt is None
+            or time.monotonic() - self._last_attempt >= self.retry_interval
+        ):
+            self._last_attempt = time.monotonic()
+            self._thread = threading.Thread(
+                target=self._follow_events, name="docker-kernel-events", daemon=True
+            )
+            self._thread.start()
+        return self._events.setdefault(kernel_id, asyncio.Event())
+
+    def unregister(self, kernel_id: str) -> None:
+        """Stops notifying the kernel of docker events."""
+        self._events.pop(kernel_id, None)
+
+    def _follow_events(self) -> None:
+        filters = {"type": ["container"], **kernel_label_filters}
+        try:
+            events = client.api.events(decode=True, filters=filters)
+            self.connected = True
+            if self._outage_logged:
+                self._outage_logged = False
+                self.log.info("Docker event stream reopened, following kernel containers.")
+            for event in events:
+                if event.get("Action") not in self.lifecycle_actions:
+                    continue
+                kernel_id = event.get("Actor", {}).get("Attributes", {}).get("kernel_id")
+                if kernel_id in self._events:
+                    self.index.invalidate()
+                    self._loop.call_soon_threadsafe(self._notify, kernel_id)
+            reason = "stream ended"
+        except Exception as err:
+            reason = err
+        finally:
+            self.connected = False
+        if not self._outage_logged:  # only log once per outage
+            self._outage_logged = True
+            self.log.warning(f"Docker event stream closed, polling kernel containers: {reason}")
+
+    def _notify(self, kernel_id: str) -> None:
+        event = self._events.get(kernel_id)
+        if event:
+            event.set()
+
+
+container_event_monitor = KernelEventMonitor(container_index)
+
+
+def _is_running_recently(proxy: ContainerProcessProxy, iteration: int | None) -> bool:
+    # While confirming startup (iteration is set) and awaiting connection info from the assigned
+    # container, a running state seen within the last docker_cache_ttl seconds is reused.
+    return bool(
+        iteration
+        and proxy.assigned_host
+        and time.monotonic() - proxy._running_time < docker_cache_ttl
+    )
 
 
 class DockerSwarmProcessProxy(ContainerProcessProxy):
@@ -31,9 +229,18 @@ class DockerSwarmProcessProxy(ContainerProcessProxy):
     Kernel lifecycle management for kernels in Docker Swarm.
     """
 
+    status_executor = docker_executor
+    initial_states: ClassVar = frozenset({"preparing", "starting", "running"})
+    error_states: ClassVar = frozenset(
+        {"failed", "rejected", "complete", "shutdown", "orphaned", "remove"}
+    )
+
     def __init__(self, kernel_manager: RemoteKernelManager, proxy_config: dict):
         """Initialize the proxy."""
         super().__init__(kernel_manager, proxy_config)
+        self._running_time = 0.0  # monotonic time at which the task was last seen running
+        self._task_filters = None  # built once the service name is known
+        self._missing_time = None  # monotonic time at which the service was found to be missing
 
     def launch_process(
         self, kernel_cmd: str, **kwargs: dict[str, Any] | None
@@ -46,53 +253,79 @@ class DockerSwarmProcessProxy(ContainerProcessProxy):
         kwargs["env"]["EG_DOCKER_MODE"] = "swarm"
         return super().launch_process(kernel_cmd, **kwargs)
 
-    def get_initial_states(self) -> set:
+    def get_initial_states(self) -> frozenset:
         """Return list of states in lowercase indicating container is starting (includes running)."""
-        return {"preparing", "starting", "running"}
+        return self.initial_states
 
-    def get_error_states(self) -> set:
+    def get_error_states(self) -> frozenset:
         """Returns the list of error states indicating container is shutting down or receiving error."""
-        return {"failed", "rejected", "complete", "shutdown", "orphaned", "remove"}
-
-    def _get_service(self) -> Service:
-        # Fetches the service object corresponding to the kernel with a matching label.
-        service = None
-        services = client.services.list(filters={"label": "kernel_id=" + self.kernel_id})
-        num_services = len(services)
-        if num_services != 1:
-            if num_services > 1:
-                msg = "{}: Found more than one service ({}) for kernel_id '{}'!".format(
-                    self.__class__.__name__, num_services, self.kernel_id
-                )
-                raise RuntimeError(msg)
-        else:
-            service = services[0]
-            self.container_name = service.name
+        return self.error_states
+
+    def _get_service(self) -> dict:
+        # Fetches the service dict corresponding to the kernel with a matching label.
+        services = service_index.get(self.kernel_id)
+        if not services:
+            return None
+        if len(services) > 1:
+            msg = "{}: Found more than one service ({}) for kernel_id '{}'!".format(
+                self.__class__.__name__, len(services), self.kernel_id
+            )
+            raise RuntimeError(msg)
+        service = services[0]
+        if self.container_name != service["Spec"]["Name"]:
+            self.container_name = service["Spec"]["Name"]
+            self._missing_time = None
+            self._task_filters = {
+                "service": [self.container_name],
+                "desired-state": ["running"],
+            }
         return service
 
     def _get_task(self) -> dict:
-        # Fetches the task object corresponding to the service associated with the kernel.  We only ask for the
-        # current task with desired-state == running.  This eliminates failed states.
+        # Fetches the task object corresponding to the service associated with the kernel.  Once the
+        # service's name is known, the task is requested directly - skipping the service lookup.
+        if self.container_name or self._get_service():
+            return self._get_service_task()
+        return None
+
+    def _get_service_task(self) -> dict:
+        # Fetches the task object of the kernel's service.  We only ask for the current task with
+        # desired-state == running.  This eliminates failed states.
+
+        # Once the service is gone, don't ask docker again for docker_cache_ttl seconds.  Each such
+        # request fails to resolve the service name, which the docker daemon logs as an error.
+        if (
+            self._missing_time is not None
+            and time.monotonic() - self._missing_time < docker_cache_ttl
+        ):
+            return None
+        try:
+            tasks = client.api.tasks(filters=self._task_filters)
+        except NotFound:  # docker resolves the service name, which fails once the service is gone
+            self._missing_time = time.monotonic()
+            return None
+        self._missing_time = None
+        if not tasks:
+            return None
+        if len(tasks) > 1:
+            msg = "{}: Found more than one task ({}) for service '{}', kernel_id '{}'!".format(
+                self.__class__.__name__, len(tasks), self.container_name, self.kernel_id
+            )
+            raise RuntimeError(msg)
+        return tasks[0]
 
-        task = None
-        service = self._get_service()
-        if service:
-            tasks = service.tasks(filters={"desired-state": "running"})
-            num_tasks = len(tasks)
-            if num_tasks != 1:
-                if num_tasks > 1:
-                    msg = "{}: Found more than one task ({}) for service '{}', kernel_id '{}'!".format(
-                        self.__class__.__name__, num_tasks, service.name, self.kernel_id
-                    )
-                    raise RuntimeError(msg)
-            else:
-                task = tasks[0]
-        return task
+    async def get_container_status_async(self, iteration: int | None) -> str:
+        """Return current container state, sharing any service index refresh with other kernels."""
+        # The service is only needed to determine the task's service name
+        if not self.container_name:
+            await service_index.refresh_if_expired()
+        return await super().get_container_status_async(iteration)
 
     def get_container_status(self, iteration: int | None) -> str:
         """Return current container state."""
-        # Locates the kernel container using the kernel_id filter.  If the status indicates an initial state we
+        # Locates the kernel container's task.  If the status indicates an initial state we
         # should be able to get at the NetworksAttachments and determine the associated container's IP address.
+        # Once determined, this method is replaced on the instance by _get_running_status().
         task_state = ""
         task_id = None
         task = self._get_task()
@@ -101,6 +334,8 @@ class DockerSwarmProcessProxy(ContainerProcessProxy):
             task_id = task["ID"]
             if task_status:
                 task_state = task_status["State"].lower()
+                if task_state == "running":
+                    self._running_time = time.monotonic()
                 if (
                     not self.assigned_host and task_state == "running"
                 ):  # in self.get_initial_states()
@@ -111,20 +346,47 @@ class DockerSwarmProcessProxy(ContainerProcessProxy):
                         ip = address.split("/")[0]
                         self.assigned_ip = ip
                         self.assigned_host = self.container_name
+                        self.get_container_status = self._get_running_status
 
+        self._log_status(iteration, task_state, task_id)
+        return task_state
+
+    def _get_running_status(self, iteration: int | None) -> str:
+        # Returns the state of the kernel container's task once its IP address has been determined.
+        if _is_running_recently(self, iteration):
+            return "running"
+
+        task_state = ""
+        task_id = None
+        task = self._get_task()
+        if task and task["Status"]:
+            task_id = task["ID"]
+            task_state = task["Status"]["State"].lower()
+            if task_state == "running":
+                self._running_time = time.monotonic()
+
+        self._log_status(iteration, task_state, task_id)
+        return task_state
+
+    def _log_status(self, iteration: int | None, task_state: str, task_id: str | None) -> None:
         if iteration:  # only log if iteration is not None (otherwise poll() is too noisy)
+            # Arguments are passed to the logger so formatting only occurs when debug is enabled
             self.log.debug(
-                "{}: Waiting to connect to docker container. "
-                "Name: '{}', Status: '{}', IPAddress: '{}', KernelID: '{}', TaskID: '{}'".format(
-                    iteration,
-                    self.container_name,
-                    task_state,
-                    self.assigned_ip,
-                    self.kernel_id,
-                    task_id,
-                )
+                "%s: Waiting to connect to docker container. "
+                "Name: '%s', Status: '%s', IPAddress: '%s', KernelID: '%s', TaskID: '%s'",
+                iteration,
+                self.container_name,
+                task_state,
+                self.assigned_ip,
+                self.kernel_id,
+                task_id,
             )
-        return task_state
+
+    @classmethod
+    async def bulk_terminate(cls, proxies: list[ContainerProcessProxy]) -> list[bool | None]:
+        """Terminates the services of multiple kernels concurrently, locating them with one listing."""
+        await service_index.refresh_if_expired()
+        return await super().bulk_terminate(proxies)
 
     def terminate_container_resources(self) -> bool | None:
         """Terminate any artifacts created on behalf of the container's lifetime."""
@@ -133,12 +395,13 @@ class DockerSwarmProcessProxy(ContainerProcessProxy):
         result = True  # We'll be optimistic
         service = self._get_service()
         if service:
+            service_index.discard(self.kernel_id)
             try:
-                service.remove()  # Service still exists, attempt removal
+                client.api.remove_service(service["ID"])  # Service still exists, attempt removal
             except Exception as err:
                 self.log.debug(
                     "{} Termination of service: {} raised exception: {}".format(
-                        self.__class__.__name__, service.name, err
+                        self.__class__.__name__, service["Spec"]["Name"], err
                     )
                 )
                 if isinstance(err, NotFound):
@@ -166,9 +429,14 @@ class DockerSwarmProcessProxy(ContainerProcessProxy):
 class DockerProcessProxy(ContainerProcessProxy):
     """Kernel lifecycle management for Docker kernels (non-Swarm)."""
 
+    status_executor = docker_executor
+    initial_states: ClassVar = frozenset({"created", "running"})
+    error_states: ClassVar = frozenset({"restarting", "removing", "paused", "exited", "dead"})
+
     def __init__(self, kernel_manager: RemoteKernelManager, proxy_config: dict):
         """Initialize the proxy."""
         super().__init__(kernel_manager, proxy_config)
+        self._running_time = 0.0  # monotonic time at which the container was last seen running
 
     def launch_process(
         self, kernel_cmd: str, **kwargs: dict[str, Any] | None
@@ -179,76 +447,131 @@ class DockerProcessProxy(ContainerProcessProxy):
         kwargs["env"]["EG_DOCKER_MODE"] = "docker"
         return super().launch_process(kernel_cmd, **kwargs)
 
-    def get_initial_states(self) -> set:
+    def get_initial_states(self) -> frozenset:
         """Return list of states in lowercase indicating container is starting (includes running)."""
-        return {"created", "running"}
+        return self.initial_states
 
-    def get_error_states(self) -> set:
+    def get_error_states(self) -> frozenset:
         """Returns the list of error states indicating container is shutting down or receiving error."""
-        return {"restarting", "removing", "paused", "exited", "dead"}
+        return self.error_states
 
-    def _get_container(self) -> Container:
-        # Fetches the container object corresponding the the kernel_id label.
+    def _get_container(self) -> dict:
+        # Fetches the container dict corresponding the the kernel_id label.
         # Only used when docker mode == regular (not swarm)
 
-        container = None
-        containers = client.containers.list(filters={"label": "kernel_id=" + self.kernel_id})
-        num_containers = len(containers)
-        if num_containers != 1:
-            if num_containers > 1:
-                msg = "{}: Found more than one container ({}) for kernel_id '{}'!".format(
-                    self.__class__.__name__, num_containers, self.kernel_id
-                )
-                raise RuntimeError(msg)
-        else:
-            container = containers[0]
-        return container
+        containers = container_index.get(self.kernel_id)
+        if not containers:
+            return None
+        if len(containers) > 1:
+            msg = "{}: Found more than one container ({}) for kernel_id '{}'!".format(
+                self.__class__.__name__, len(containers), self.kernel_id
+            )
+            raise RuntimeError(msg)
+        return containers[0]
+
+    async def confirm_remote_startup(self) -> None:
+        """Confirms the container has started, following docker's events while doing so."""
+        try:
+            await super().confirm_remote_startup()
+        finally:
+            container_event_monitor.unregister(self.kernel_id)
+
+    async def handle_timeout(self, delay: float = poll_interval) -> None:
+        """Waits up to `delay` seconds for a docker event on the kernel's container, then checks
+        whether the kernel launch timeout has been exceeded.
+
+        Until the container's address is known, events drive the status checks, so polling only
+        occurs at the maximum poll delay as a fallback.
+        """
+        event = container_event_monitor.register(self.kernel_id, self.log)
+        if not self.assigned_host and container_event_monitor.connected:
+            delay = max(delay, poll_interval * 2)
+        try:
+            await asyncio.wait_for(event.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+        event.clear()
+        await super().handle_timeout(0)
+
+    async def get_container_status_async(self, iteration: int | None) -> str:
+        """Return current container state, sharing any container index refresh with other kernels."""
+        if not _is_running_recently(self, iteration):
+            await container_index.refresh_if_expired()
+        return await super().get_container_status_async(iteration)
 
     def get_container_status(self, iteration: int | None) -> str:
         """Return current container state."""
         # Locates the kernel container using the kernel_id filter.  If the phase indicates Running, the pod's IP
         # is used for the assigned_ip.  Only used when docker mode == regular (non swarm)
+        # Once determined, this method is replaced on the instance by _get_running_status().
         container_status = ""
 
         container = self._get_container()
         if container:
-            self.container_name = container.name
-            if container.status:
-                container_status = container.status.lower()
+            self.container_name = container["Names"][0].lstrip("/")
+            if container["State"]:
+                container_status = container["State"].lower()
+                if container_status == "running":
+                    self._running_time = time.monotonic()
                 if container_status == "running" and not self.assigned_host:
                     # Container is running, capture IP
-
-                    # we'll use this as a fallback in case we don't find our network
-                    self.assigned_ip = container.attrs.get("NetworkSettings").get("IPAddress")
-                    networks = container.attrs.get("NetworkSettings").get("Networks")
-                    if len(networks) > 0:
-                        self.assigned_ip = networks.get(docker_network).get("IPAddress")
+                    networks = container["NetworkSettings"]["Networks"]
+                    # we'll use any other network as a fallback in case we don't find ours
+                    network = networks.get(docker_network) or next(iter(networks.values()), {})
+                    self.assigned_ip = network.get("IPAddress")
+                    if docker_network in networks:
                         self.log.debug(
-                            "Using assigned_ip {} from docker network '{}'.".format(
-                                self.assigned_ip, docker_network
-                            )
+                            "Using assigned_ip %s from docker network '%s'.",
+                            self.assigned_ip,
+                            docker_network,
                         )
                     else:
                         self.log.warning(
-                            "Docker network '{}' could not be located in container attributes - "
-                            "using assigned_ip '{}'.".format(docker_network, self.assigned_ip)
+                            "Docker network '%s' could not be located in container attributes - "
+                            "using assigned_ip '%s'.",
+                            docker_network,
+                            self.assigned_ip,
                         )
 
                     self.assigned_host = self.container_name
+                    self.get_container_status = self._get_running_status
+
+        self._log_status(iteration, container_status)
+        return container_status
+
+    def _get_running_status(self, iteration: int | None) -> str:
+        # Returns the state of the kernel container once its IP address has been determined.
+        if _is_running_recently(self, iteration):
+            return "running"
 
+        container_status = ""
+        container = self._get_container()
+        if container and container["State"]:
+            container_status = container["State"].lower()
+            if container_status == "running":
+                self._running_time = time.monotonic()
+
+        self._log_status(iteration, container_status)
+        return container_status
+
+    def _log_status(self, iteration: int | None, container_status: str) -> None:
         if iteration:  # only log if iteration is not None (otherwise poll() is too noisy)
+            # Arguments are passed to the logger so formatting only occurs when debug is enabled
             self.log.debug(
-                "{}: Waiting to connect to docker container. "
-                "Name: '{}', Status: '{}', IPAddress: '{}', KernelID: '{}'".format(
-                    iteration,
-                    self.container_name,
-                    container_status,
-                    self.assigned_ip,
-                    self.kernel_id,
-                )
+                "%s: Waiting to connect to docker container. "
+                "Name: '%s', Status: '%s', IPAddress: '%s', KernelID: '%s'",
+                iteration,
+                self.container_name,
+                container_status,
+                self.assigned_ip,
+                self.kernel_id,
             )
 
-        return container_status
+    @classmethod
+    async def bulk_terminate(cls, proxies: list[ContainerProcessProxy]) -> list[bool | None]:
+        """Terminates the containers of multiple kernels concurrently, locating them with one listing."""
+        await container_index.refresh_if_expired()
+        return await super().bulk_terminate(proxies)
 
     def terminate_container_resources(self) -> bool | None:
         """Terminate any artifacts created on behalf of the container's lifetime."""
@@ -257,11 +580,13 @@ class DockerProcessProxy(ContainerProcessProxy):
         result = True  # Since we run containers with remove=True, we'll be optimistic
         container = self._get_container()
         if container:
+            container_index.discard(self.kernel_id)
             try:
-                container.remove(force=True)  # Container still exists, attempt forced removal
+                # Container still exists, attempt forced removal (including its anonymous volumes)
+                client.api.remove_container(container["Id"], v=True, force=True)
             except Exception as err:
                 self.log.debug(
-                    f"Container termination for container: {container.name} raised exception: {err}"
+                    f"Container termination for container: {self.container_name} raised exception: {err}"
                 )
                 if isinstance(err, NotFound):
                     pass  # okay if its not found
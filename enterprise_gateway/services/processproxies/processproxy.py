@@ -1468,11 +1468,16 @@ class RemoteProcessProxy(BaseProcessProxyABC, metaclass=abc.ABCMeta):
             ):  # only unset local_proc if we're remote
                 self.local_proc = None
 
-    async def handle_timeout(self):
+    async def handle_timeout(self, delay: float = poll_interval):
         """
         Checks to see if the kernel launch timeout has been exceeded while awaiting connection info.
+
+        Parameters
+        ----------
+        delay : float
+            The number of seconds to wait prior to checking.  Defaults to EG_POLL_INTERVAL.
         """
-        await asyncio.sleep(poll_interval)
+        await asyncio.sleep(delay)
         time_interval = RemoteProcessProxy.get_time_diff(
             self.start_time, RemoteProcessProxy.get_current_time()
         )
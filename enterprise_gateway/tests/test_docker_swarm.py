@@ -0,0 +1,383 @@
+# Copyright (c) Jupyter Development Team.
+# Distributed under the terms of the Modified BSD License.
+"""Tests for the docker kernel index, event monitor and process proxies."""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from docker.errors import NotFound
+
+# The docker client is created at import, which requires a daemon, so use a mock in its place.
+with mock.patch("docker.client.DockerClient.from_env"):
+    from enterprise_gateway.services.processproxies import docker_swarm
+
+from enterprise_gateway.services.processproxies.docker_swarm import (
+    DockerProcessProxy,
+    DockerSwarmProcessProxy,
+    KernelEventMonitor,
+    KernelResourceIndex,
+)
+from enterprise_gateway.services.processproxies.processproxy import (
+    RemoteProcessProxy,
+    poll_interval,
+)
+
+log = logging.getLogger("test_docker_swarm")
+
+
+def container(kernel_id):
+    return {"Id": f"id-{kernel_id}", "Labels": {"kernel_id": kernel_id}}
+
+
+class CountingLister:
+    """Lists the given resources, counting the calls and optionally delaying or failing them."""
+
+    def __init__(self, resources, delay=0.0, error=None):
+        self.resources = resources
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    def __call__(self, filters):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return list(self.resources)
+
+
+def make_index(lister, ttl=60.0):
+    return KernelResourceIndex(lister, lambda resource: resource["Labels"]["kernel_id"], ttl)
+
+
+def test_index_groups_resources_by_kernel_id():
+    lister = CountingLister([container("k1"), container("k2"), container("k2")])
+    index = make_index(lister)
+
+    assert index.get("k1") == [container("k1")]
+    assert len(index.get("k2")) == 2
+    assert index.get("k3") == []
+    assert lister.calls == 1
+
+
+def test_index_refreshes_once_expired():
+    lister = CountingLister([container("k1")])
+    index = make_index(lister, ttl=0.05)
+
+    index.get("k1")
+    index.get("k1")
+    assert lister.calls == 1
+
+    time.sleep(0.06)
+    assert index.is_expired()
+    index.get("k1")
+    assert lister.calls == 2
+
+
+def test_index_discard_and_invalidate():
+    lister = CountingLister([container("k1"), container("k2")])
+    index = make_index(lister)
+    index.get("k1")
+
+    index.discard("k1")
+    assert index.get("k1") == []
+    assert index.get("k2") == [container("k2")]
+    assert lister.calls == 1
+
+    index.invalidate()
+    assert index.is_expired()
+    assert index.get("k1") == [container("k1")]
+    assert lister.calls == 2
+
+
+async def test_concurrent_refreshes_share_one_listing():
+    lister = CountingLister([container("k1")], delay=0.1)
+    index = make_index(lister)
+
+    await asyncio.gather(*(index.refresh_if_expired() for _ in range(5)))
+    assert lister.calls == 1
+    assert index._pending_refresh is None
+
+    await index.refresh_if_expired()  # not expired, so no listing
+    assert lister.calls == 1
+    assert index.get("k1") == [container("k1")]
+
+
+async def test_failed_refresh_reaches_every_caller():
+    lister = CountingLister([], delay=0.1, error=RuntimeError("docker is down"))
+    index = make_index(lister)
+
+    results = await asyncio.gather(
+        *(index.refresh_if_expired() for _ in range(3)), return_exceptions=True
+    )
+    assert lister.calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert index._pending_refresh is None
+    assert index.is_expired()
+
+    lister.error = None
+    await index.refresh_if_expired()
+    assert lister.calls == 2
+    assert not index.is_expired()
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+@pytest.fixture
+def docker_client(monkeypatch):
+    client = mock.Mock()
+    monkeypatch.setattr(docker_swarm, "client", client)
+    return client
+
+
+@pytest.fixture
+def monitor(monkeypatch):
+    monitor = KernelEventMonitor(make_index(CountingLister([])))
+    monkeypatch.setattr(docker_swarm, "container_event_monitor", monitor)
+    return monitor
+
+
+async def test_monitor_not_connected_until_stream_opens(docker_client, monitor):
+    opened = threading.Event()
+    release = threading.Event()
+
+    def events(decode, filters):
+        opened.set()
+        release.wait(2.0)
+        return iter(())
+
+    docker_client.api.events.side_effect = events
+    monitor.register("k1", log)
+
+    assert opened.wait(2.0)
+    assert not monitor.connected  # the subscription is still pending
+    release.set()
+    assert wait_for(lambda: not monitor._thread.is_alive())
+    assert not monitor.connected
+
+
+async def test_monitor_unavailable_stream_is_retried_at_interval(docker_client, monitor, caplog):
+    docker_client.api.events.side_effect = RuntimeError("/events is forbidden")
+
+    for kernel_id in ("k1", "k2", "k1"):
+        monitor.register(kernel_id, log)
+        assert wait_for(lambda: not monitor._thread.is_alive())
+        assert not monitor.connected
+    assert docker_client.api.events.call_count == 1
+
+    monitor.retry_interval = 0.0
+    monitor.register("k1", log)
+    assert wait_for(lambda: docker_client.api.events.call_count == 2)
+    assert wait_for(lambda: not monitor._thread.is_alive())
+
+    closed = [r for r in caplog.records if "Docker event stream closed" in r.getMessage()]
+    assert len(closed) == 1  # logged once per outage
+
+
+async def test_unavailable_stream_does_not_extend_poll_delay(docker_client, monitor):
+    docker_client.api.events.side_effect = RuntimeError("/events is forbidden")
+    proxy = DockerProcessProxy.__new__(DockerProcessProxy)
+    proxy.kernel_id = "k1"
+    proxy.log = log
+    proxy.assigned_host = ""
+    proxy.kernel_launch_timeout = 30
+    proxy.start_time = RemoteProcessProxy.get_current_time()
+
+    for _ in range(3):
+        start = time.monotonic()
+        await proxy.handle_timeout(0.05)
+        assert time.monotonic() - start < 0.5
+
+
+async def test_monitor_notifies_registered_kernels_of_lifecycle_events(docker_client, monitor):
+    def event(action, kernel_id):
+        return {"Action": action, "Actor": {"Attributes": {"kernel_id": kernel_id}}}
+
+    release = threading.Event()
+
+    def events(decode, filters):
+        yield event("exec_start", "k1")
+        yield event("health_status", "k1")
+        yield event("start", "k2")  # not registered
+        release.wait(2.0)
+        yield event("start", "k1")
+
+    docker_client.api.events.side_effect = events
+    monitor.index.get("k1")  # populate the index
+    k1_event = monitor.register("k1", log)
+    assert wait_for(lambda: monitor.connected)
+
+    await asyncio.sleep(0.1)
+    assert not k1_event.is_set()
+    assert not monitor.index.is_expired()
+
+    release.set()
+    await asyncio.wait_for(k1_event.wait(), 2.0)
+    assert monitor.index.is_expired()
+
+
+def docker_proxy(kernel_id, container_name=None):
+    proxy = DockerProcessProxy.__new__(DockerProcessProxy)
+    proxy.kernel_id = kernel_id
+    proxy.log = log
+    proxy.container_name = f"name-{kernel_id}" if container_name is None else container_name
+    return proxy
+
+
+async def test_bulk_terminate_locates_containers_with_one_listing(docker_client, monkeypatch):
+    kernel_ids = [f"k{i}" for i in range(4)]
+    lister = CountingLister([container(kernel_id) for kernel_id in kernel_ids])
+    monkeypatch.setattr(docker_swarm, "container_index", make_index(lister))
+    executor = ThreadPoolExecutor(max_workers=len(kernel_ids), thread_name_prefix="status")
+    monkeypatch.setattr(DockerProcessProxy, "status_executor", executor)
+
+    # Each removal waits on the others, so this only completes if they run concurrently.
+    barrier = threading.Barrier(len(kernel_ids), timeout=2.0)
+    removed = {}
+
+    def remove_container(container_id, v, force):
+        barrier.wait()
+        removed[container_id] = threading.current_thread().name
+
+    docker_client.api.remove_container.side_effect = remove_container
+
+    proxies = [docker_proxy(kernel_id) for kernel_id in kernel_ids]
+    proxies.append(docker_proxy("unnamed", container_name=""))
+
+    try:
+        results = await DockerProcessProxy.bulk_terminate(proxies)
+    finally:
+        executor.shutdown()
+
+    assert results == [None] * len(proxies)  # terminated, per the jupyter contract
+    assert lister.calls == 1
+    assert sorted(removed) == [f"id-{kernel_id}" for kernel_id in kernel_ids]
+    assert all(name.startswith("status") for name in removed.values())
+
+
+async def test_bulk_terminate_reports_failures_as_false(docker_client, monkeypatch):
+    # k1 has two containers, so locating it raises, which shouldn't affect k2's termination
+    lister = CountingLister([container("k1"), container("k1"), container("k2")])
+    monkeypatch.setattr(docker_swarm, "container_index", make_index(lister))
+
+    results = await DockerProcessProxy.bulk_terminate([docker_proxy("k1"), docker_proxy("k2")])
+
+    assert results == [False, None]
+    docker_client.api.remove_container.assert_called_once_with("id-k2", v=True, force=True)
+
+
+def service(kernel_id):
+    return {
+        "ID": f"id-{kernel_id}",
+        "Spec": {"Name": f"name-{kernel_id}", "Labels": {"kernel_id": kernel_id}},
+    }
+
+
+def task(state, address="10.0.0.5/24"):
+    return {
+        "ID": "task-id",
+        "Status": {"State": state},
+        "NetworksAttachments": [{"Addresses": [address]}],
+    }
+
+
+@pytest.fixture
+def services(monkeypatch):
+    lister = CountingLister([service("k1")])
+    index = KernelResourceIndex(
+        lister, lambda resource: resource["Spec"]["Labels"]["kernel_id"], 60.0
+    )
+    monkeypatch.setattr(docker_swarm, "service_index", index)
+    return lister
+
+
+def swarm_proxy(kernel_id):
+    proxy = DockerSwarmProcessProxy.__new__(DockerSwarmProcessProxy)
+    proxy.kernel_id = kernel_id
+    proxy.log = log
+    proxy.container_name = ""
+    proxy.assigned_host = ""
+    proxy.assigned_ip = None
+    proxy._running_time = 0.0
+    proxy._task_filters = None
+    proxy._missing_time = None
+    return proxy
+
+
+def test_swarm_task_requested_by_service_name(docker_client, services):
+    docker_client.api.tasks.return_value = [task("starting")]
+    proxy = swarm_proxy("k1")
+
+    assert proxy._get_task() == task("starting")
+    assert proxy.container_name == "name-k1"
+    docker_client.api.tasks.assert_called_with(
+        filters={"service": ["name-k1"], "desired-state": ["running"]}
+    )
+
+    # Once the service name is known, the service is no longer looked up
+    docker_swarm.service_index.invalidate()
+    assert proxy._get_task() == task("starting")
+    assert services.calls == 1
+    assert docker_client.api.tasks.call_count == 2
+
+
+def test_missing_swarm_service_is_remembered(docker_client, services, monkeypatch):
+    docker_client.api.tasks.side_effect = NotFound("service name-k1 not found")
+    proxy = swarm_proxy("k1")
+
+    assert proxy._get_task() is None
+    assert proxy._get_task() is None  # within docker_cache_ttl, so docker isn't asked again
+    assert docker_client.api.tasks.call_count == 1
+
+    monkeypatch.setattr(docker_swarm, "docker_cache_ttl", 0.0)
+    docker_client.api.tasks.side_effect = None
+    docker_client.api.tasks.return_value = [task("running")]
+    assert proxy._get_task() == task("running")
+    assert docker_client.api.tasks.call_count == 2
+    assert proxy._missing_time is None
+
+
+def test_swarm_status_switches_to_running_phase_once_addressed(docker_client, services):
+    docker_client.api.tasks.return_value = [task("starting")]
+    proxy = swarm_proxy("k1")
+
+    assert proxy.get_container_status(1) == "starting"
+    assert "get_container_status" not in vars(proxy)  # not yet rebound
+
+    docker_client.api.tasks.return_value = [task("running")]
+    assert proxy.get_container_status(2) == "running"
+    assert proxy.assigned_ip == "10.0.0.5"
+    assert proxy.assigned_host == "name-k1"
+    assert proxy.get_container_status == proxy._get_running_status
+
+    # While confirming startup, the recent running state is reused
+    assert proxy.get_container_status(3) == "running"
+    assert docker_client.api.tasks.call_count == 2
+
+    # Otherwise (e.g., from poll()), the task's state is requested
+    docker_client.api.tasks.return_value = [task("shutdown")]
+    assert proxy.get_container_status(None) == "shutdown"
+    assert docker_client.api.tasks.call_count == 3
+
+
+def test_next_poll_delay_backs_off_to_cap():
+    proxy = DockerProcessProxy.__new__(DockerProcessProxy)
+    delays = [proxy.next_poll_delay(i) for i in range(1, 8)]
+
+    assert delays[0] == pytest.approx(poll_interval / 10)
+    assert delays[1] == pytest.approx(poll_interval / 5)
+    assert delays == sorted(delays)
+    assert delays[-1] == pytest.approx(poll_interval * 2)
+    # Long launches (e.g., large image pulls) keep polling at the cap
+    assert proxy.next_poll_delay(1025) == pytest.approx(poll_interval * 2)
+    assert proxy.next_poll_delay(10**6) == pytest.approx(poll_interval * 2)